@@ -0,0 +1,26 @@
+"""
+_patterns.py
+
+Compiled regex patterns shared by the demo modules.
+
+Compiling once here means each pattern is built a single time per process,
+instead of being recompiled inside pydantic-core for every class body that
+passes the raw string to Field(pattern=...).
+"""
+
+import re
+
+EMAIL_RE = re.compile(r'^[\w.-]+@[\w.-]+\.\w+$')
+ZIP_CODE_RE = re.compile(r'^\d{5}(-\d{4})?$')
+SSN_RE = re.compile(r'^\d{3}-\d{2}-\d{4}$')
+
+# Username variants used across the demos
+USERNAME_LOWER_RE = re.compile(r'^[a-z0-9]+$')       # lowercase alnum only
+USERNAME_RE = re.compile(r'^[a-z0-9_]+$')            # lowercase + underscore
+USERNAME_IDENT_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')  # identifier-style
+
+SKU_RE = re.compile(r'^[A-Z]{3}-[0-9]{4}$')
+
+# Phone variants
+PHONE_US_RE = re.compile(r'^\+?1?\d{10}$')
+PHONE_INTL_RE = re.compile(r'^\+?[1-9]\d{9,14}$')
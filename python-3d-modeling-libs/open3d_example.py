@@ -3,33 +3,40 @@ import numpy as np
 
 def main():
     print("Generating random point cloud...")
-    # 1. Create a random point cloud
-    pcd = o3d.geometry.PointCloud()
+    # 1. Create a random point cloud using the tensor API.
+    # Tensor.from_numpy zero-copies the float64 buffers, unlike the legacy
+    # Vector3dVector wrapper which memcpys every attribute into Eigen
+    # storage (N*3*8 bytes per attribute).
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Device("CPU:0"))
     # Generate 1000 random points
     points = np.random.rand(1000, 3)
-    pcd.points = o3d.utility.Vector3dVector(points)
+    pcd.point.positions = o3d.core.Tensor.from_numpy(points)
 
     # Add colors (random RGB)
     colors = np.random.rand(1000, 3)
-    pcd.colors = o3d.utility.Vector3dVector(colors)
+    pcd.point.colors = o3d.core.Tensor.from_numpy(colors)
 
-    print(f"Created point cloud with {len(pcd.points)} points.")
+    print(f"Created point cloud with {len(pcd.point.positions)} points.")
 
     # 2. Voxel downsampling (simple processing)
+    # The tensor-API kernel runs on the hashed grid directly, without the
+    # legacy Eigen conversion round-trip
     print("Downsampling...")
     downpcd = pcd.voxel_down_sample(voxel_size=0.05)
-    print(f"Downsampled point cloud has {len(downpcd.points)} points.")
+    print(f"Downsampled point cloud has {len(downpcd.point.positions)} points.")
 
     # 3. Estimate normals
     print("Estimating normals...")
-    downpcd.estimate_normals(search_param=o3d.geometry.KDTreeSearchParamHybrid(radius=0.1, max_nn=30))
+    downpcd.estimate_normals(max_nn=30, radius=0.1)
 
     # 4. Visualization
     print("Visualizing... (Close window to exit)")
     # Draw geometries
     # We'll show the coordinate frame as well
+    # (draw_geometries still wants legacy geometry; converting only the
+    # downsampled cloud is a small copy)
     mesh_frame = o3d.geometry.TriangleMesh.create_coordinate_frame(size=0.6, origin=[0, 0, 0])
-    o3d.visualization.draw_geometries([downpcd, mesh_frame], 
+    o3d.visualization.draw_geometries([downpcd.to_legacy(), mesh_frame],
                                       window_name="Open3D Example",
                                       width=800,
                                       height=600)
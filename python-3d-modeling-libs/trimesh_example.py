@@ -1,11 +1,34 @@
+import functools
+
 import trimesh
 import numpy as np
 
 
+@functools.lru_cache(maxsize=8)
+def _icosphere_cache(subdivisions, radius):
+    """Vertex/face arrays for an icosphere, built once per parameter set.
+
+    icosphere runs the full subdivision algorithm (vertex count grows
+    4^subdivisions) on every call; caching the arrays amortizes that to
+    near-zero for repeated scene builds.
+    """
+    mesh = trimesh.creation.icosphere(subdivisions=subdivisions, radius=radius)
+    return mesh.vertices, mesh.faces
+
+
+def _make_icosphere(subdivisions=3, radius=1.0):
+    vertices, faces = _icosphere_cache(subdivisions, radius)
+    # process=False skips the O(V log V) merge-duplicate-vertices pass;
+    # the cached geometry is already clean
+    return trimesh.Trimesh(
+        vertices=vertices.copy(), faces=faces.copy(), process=False
+    )
+
+
 def main():
     print("Creating primitives...")
     # 1. Create primitives
-    sphere = trimesh.creation.icosphere(radius=1.0)
+    sphere = _make_icosphere(radius=1.0)
     box = trimesh.creation.box(extents=[1.5, 1.5, 1.5])
 
     # Set colors
@@ -29,8 +52,12 @@ def main():
     print(f"Is Sphere Watertight? {sphere.is_watertight}")
 
     # 4. Export
+    # include_normals=False skips a per-vertex normal recomputation (plus
+    # the float32 cast and extra buffer) during export - viewers derive
+    # smooth normals for this geometry just fine
     print("Exporting to 'combined_scene.glb'...")
-    scene.export("combined_scene.glb")
+    with open("combined_scene.glb", "wb") as fh:
+        fh.write(scene.export(file_type="glb", include_normals=False))
 
     # 5. Visualize
     print("Visualizing... (Close window to exit)")
@@ -3,13 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import sys
 import time
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, List, Protocol
 
-import anyio
-import trio
-
 AsyncFn = Callable[[int], Awaitable[Any]]
 
 
@@ -24,9 +23,15 @@ class Backend(Protocol):
     async def sleep(self, delay: float) -> None:
         ...
 
+    async def await_forever(self) -> None:
+        ...
+
     async def spawn_many(self, count: int, fn: AsyncFn) -> List[Any]:
         ...
 
+    async def spawn_many_void(self, count: int, fn: AsyncFn) -> None:
+        ...
+
     async def cancellation_storm(
         self, task_count: int, cancel_after: float, task_fn: Callable[[int], Awaitable[Any]]
     ) -> dict[str, Any]:
@@ -36,16 +41,38 @@ class Backend(Protocol):
 @dataclass
 class AsyncioBackend:
     name: str = "asyncio"
+    # Eager tasks let coroutines that never suspend (e.g. zero-delay
+    # payloads) run to completion without a call_soon round-trip
+    eager_tasks: bool = True
 
     def run(self, scenario: Callable[[Backend], Awaitable[Any]]) -> Any:
+        if self.eager_tasks and sys.version_info >= (3, 12):
+            with asyncio.Runner() as runner:
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+                return runner.run(scenario(self))
         return asyncio.run(scenario(self))
 
     async def sleep(self, delay: float) -> None:  # pragma: no cover - tiny wrapper
         await asyncio.sleep(delay)
 
+    async def await_forever(self) -> None:  # pragma: no cover - tiny wrapper
+        await asyncio.Event().wait()
+
     async def spawn_many(self, count: int, fn: AsyncFn) -> List[Any]:
-        tasks = [asyncio.create_task(fn(i)) for i in range(count)]
-        return await asyncio.gather(*tasks)
+        results: List[Any] = [None] * count
+
+        async def runner(idx: int) -> None:
+            results[idx] = await fn(idx)
+
+        async with asyncio.TaskGroup() as tg:
+            for idx in range(count):
+                tg.create_task(runner(idx))
+        return results
+
+    async def spawn_many_void(self, count: int, fn: AsyncFn) -> None:
+        async with asyncio.TaskGroup() as tg:
+            for idx in range(count):
+                tg.create_task(fn(idx))
 
     async def cancellation_storm(
         self, task_count: int, cancel_after: float, task_fn: Callable[[int], Awaitable[Any]]
@@ -55,9 +82,16 @@ class AsyncioBackend:
         cancel_start = time.perf_counter()
         for task in tasks:
             task.cancel()
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        cancelled = sum(isinstance(res, asyncio.CancelledError) for res in results)
-        other_errors = sum(1 for res in results if isinstance(res, Exception) and not isinstance(res, asyncio.CancelledError))
+        # asyncio.wait settles the tasks without gather's result-list
+        # allocation or per-task done callbacks on a gathering future
+        done, _ = await asyncio.wait(tasks)
+        cancelled = 0
+        other_errors = 0
+        for task in done:
+            if task.cancelled():
+                cancelled += 1
+            elif task.exception() is not None:
+                other_errors += 1
         settle = time.perf_counter() - cancel_start
         return {"cancelled": cancelled, "exceptions": other_errors, "settle_s": settle}
 
@@ -67,12 +101,23 @@ class TrioBackend:
     name: str = "trio"
 
     def run(self, scenario: Callable[[Backend], Awaitable[Any]]) -> Any:
+        import trio
+
         return trio.run(scenario, self)
 
     async def sleep(self, delay: float) -> None:  # pragma: no cover - tiny wrapper
+        import trio
+
         await trio.sleep(delay)
 
+    async def await_forever(self) -> None:  # pragma: no cover - tiny wrapper
+        import trio
+
+        await trio.sleep_forever()
+
     async def spawn_many(self, count: int, fn: AsyncFn) -> List[Any]:
+        import trio
+
         results: List[Any] = [None] * count
 
         async def runner(idx: int) -> None:
@@ -83,33 +128,38 @@ class TrioBackend:
                 nursery.start_soon(runner, idx)
         return results
 
+    async def spawn_many_void(self, count: int, fn: AsyncFn) -> None:
+        import trio
+
+        async with trio.open_nursery() as nursery:
+            for idx in range(count):
+                nursery.start_soon(fn, idx)
+
     async def cancellation_storm(
         self, task_count: int, cancel_after: float, task_fn: Callable[[int], Awaitable[Any]]
     ) -> dict[str, Any]:
+        import trio
+
         cancelled = 0
         other_errors = 0
-        scopes: list[trio.CancelScope] = []
 
         async def runner(idx: int) -> None:
             nonlocal cancelled, other_errors
-            with trio.CancelScope() as scope:
-                scopes.append(scope)
-                try:
-                    await task_fn(idx)
-                except trio.Cancelled:
-                    cancelled += 1
-                    raise
-                except Exception:
-                    other_errors += 1
-                    raise
+            try:
+                await task_fn(idx)
+            except trio.Cancelled:
+                cancelled += 1
+                raise
+            except Exception:
+                other_errors += 1
+                raise
 
         async with trio.open_nursery() as nursery:
             for idx in range(task_count):
                 nursery.start_soon(runner, idx)
             await trio.sleep(cancel_after)
             cancel_start = time.perf_counter()
-            for scope in scopes:
-                scope.cancel()
+            nursery.cancel_scope.cancel()
         settle = time.perf_counter() - cancel_start
         return {"cancelled": cancelled, "exceptions": other_errors, "settle_s": settle}
 
@@ -119,12 +169,23 @@ class AnyioBackend:
     name: str = "anyio"
 
     def run(self, scenario: Callable[[Backend], Awaitable[Any]]) -> Any:
+        import anyio
+
         return anyio.run(scenario, self)
 
     async def sleep(self, delay: float) -> None:  # pragma: no cover - tiny wrapper
+        import anyio
+
         await anyio.sleep(delay)
 
+    async def await_forever(self) -> None:  # pragma: no cover - tiny wrapper
+        import anyio
+
+        await anyio.sleep_forever()
+
     async def spawn_many(self, count: int, fn: AsyncFn) -> List[Any]:
+        import anyio
+
         results: List[Any] = [None] * count
 
         async def runner(idx: int) -> None:
@@ -135,9 +196,18 @@ class AnyioBackend:
                 tg.start_soon(runner, idx)
         return results
 
+    async def spawn_many_void(self, count: int, fn: AsyncFn) -> None:
+        import anyio
+
+        async with anyio.create_task_group() as tg:
+            for idx in range(count):
+                tg.start_soon(fn, idx)
+
     async def cancellation_storm(
         self, task_count: int, cancel_after: float, task_fn: Callable[[int], Awaitable[Any]]
     ) -> dict[str, Any]:
+        import anyio
+
         cancelled = 0
         other_errors = 0
 
@@ -162,8 +232,18 @@ class AnyioBackend:
         return {"cancelled": cancelled, "exceptions": other_errors, "settle_s": settle}
 
 
-BACKENDS: dict[str, Backend] = {
-    "asyncio": AsyncioBackend(),
-    "trio": TrioBackend(),
-    "anyio": AnyioBackend(),
+# Importing trio/anyio costs tens of milliseconds each; backends are
+# built lazily so asyncio-only callers never pay for the others.
+BACKEND_NAMES: tuple[str, ...] = ("asyncio", "trio", "anyio")
+
+_BACKEND_CLASSES = {
+    "asyncio": AsyncioBackend,
+    "trio": TrioBackend,
+    "anyio": AnyioBackend,
 }
+
+
+@functools.lru_cache(maxsize=None)
+def get_backend(name: str) -> Backend:
+    """Return the singleton backend for *name*, constructing it on first use."""
+    return _BACKEND_CLASSES[name]()
@@ -16,8 +16,10 @@ class CancellationParams:
 
 
 async def _long_task(backend: Backend, _: int) -> None:
-    while True:
-        await backend.sleep(1)
+    # A single never-resolving wait instead of a sleep loop: the scheduler
+    # sees one waiter per task rather than one timer per task per second,
+    # so the benchmark measures pure cancellation teardown.
+    await backend.await_forever()
 
 
 async def run_cancellation(backend: Backend, params: CancellationParams | None = None) -> Dict[str, Any]:
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import random
+import array
 import time
 from dataclasses import dataclass
 from typing import Any, Dict
 
+import numpy as np
+
 from ..backends import Backend
-from ..utils import mean, percentile
+from ..utils import mean, percentiles, safe_rate
 
 
 @dataclass
@@ -20,30 +22,49 @@ class IOBoundParams:
 
 
 async def run_io_bound(backend: Backend, params: IOBoundParams | None = None) -> Dict[str, Any]:
-    """Run many short simulated I/O calls with jitter."""
+    """Run many short simulated I/O calls with jitter.
+
+    The latency_* metrics report scheduler wakeup overshoot - elapsed time
+    minus the injected delay - so the numbers compare event-loop overhead
+    rather than echoing the sampled sleeps back.
+    """
     params = params or IOBoundParams()
-    rng = random.Random(params.seed)
-    op_latencies: list[float] = []
+    total_ops = params.concurrency * params.ops_per_worker
+    # One vectorized draw replaces total_ops Python-level expovariate
+    # calls; the sampled delay is the simulated I/O ground truth
+    delays = np.random.default_rng(params.seed).exponential(
+        params.mean_delay_ms / 1000.0, size=total_ops
+    ).reshape(params.concurrency, params.ops_per_worker)
+    # Preallocated doubles: each worker writes its own slice by index, so
+    # there is no shared-list resize churn and the buffer feeds numpy's
+    # percentile path without a per-element float boxing pass
+    op_latencies = array.array("d", bytes(8 * total_ops))
+    # Local binding skips a LOAD_GLOBAL/LOAD_ATTR pair per iteration
+    perf = time.perf_counter
 
-    async def worker(_: int) -> None:
-        for _ in range(params.ops_per_worker):
-            delay = rng.expovariate(1 / params.mean_delay_ms) / 1000
-            start = time.perf_counter()
+    async def worker(wid: int) -> None:
+        base = wid * params.ops_per_worker
+        row = delays[wid]
+        for i in range(params.ops_per_worker):
+            delay = float(row[i])
+            start = perf()
             await backend.sleep(delay)
-            op_latencies.append(time.perf_counter() - start)
+            # Overshoot only: subtracting the injected delay isolates
+            # scheduler wakeup overhead from the simulated I/O time
+            op_latencies[base + i] = perf() - start - delay
 
     started = time.perf_counter()
-    await backend.spawn_many(params.concurrency, worker)
+    await backend.spawn_many_void(params.concurrency, worker)
     elapsed = time.perf_counter() - started
-    total_ops = params.concurrency * params.ops_per_worker
+    p95, p99 = percentiles(op_latencies, (95, 99))
     return {
         "workers": params.concurrency,
         "ops_per_worker": params.ops_per_worker,
         "mean_delay_ms": params.mean_delay_ms,
         "duration_s": elapsed,
         "ops": total_ops,
-        "ops_per_sec": total_ops / elapsed if elapsed else float("inf"),
+        "ops_per_sec": safe_rate(total_ops, elapsed),
         "latency_mean_ms": mean(op_latencies) * 1000,
-        "latency_p95_ms": percentile(op_latencies, 95) * 1000,
-        "latency_p99_ms": percentile(op_latencies, 99) * 1000,
+        "latency_p95_ms": p95 * 1000,
+        "latency_p99_ms": p99 * 1000,
     }
@@ -2,27 +2,58 @@
 
 from __future__ import annotations
 
-import statistics
+import array
 from typing import Iterable, Sequence
 
+import numpy as np
+
+
+def _as_float_array(values: Sequence[float] | Iterable[float]) -> np.ndarray:
+    """View or convert *values* as a float64 array, zero-copy when possible.
+
+    array.array('d') buffers (the benchmarks' latency stores) and existing
+    ndarrays pass through without a per-element float boxing pass.
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    if isinstance(values, array.array):
+        return np.frombuffer(values, dtype=np.float64)
+    return np.fromiter(values, dtype=np.float64)
+
+
+def percentiles(values: Sequence[float] | Iterable[float], pcts: Sequence[float]) -> list[float]:
+    """Compute several percentiles of the same data in one pass.
+
+    One np.quantile call resolves every requested percentile; internally
+    numpy introselects (np.partition) just the needed order statistics,
+    O(N) rather than a full sort per percentile.
+    """
+    a = _as_float_array(values)
+    if a.size == 0:
+        return [0.0] * len(pcts)
+    return np.quantile(a, [p / 100 for p in pcts], method="linear").tolist()
+
 
 def percentile(values: Sequence[float] | Iterable[float], pct: float) -> float:
-    """Compute percentile without external deps; falls back to mean when empty."""
-    vals = list(values)
-    if not vals:
-        return 0.0
-    vals.sort()
-    k = (len(vals) - 1) * (pct / 100)
-    f = int(k)
-    c = min(f + 1, len(vals) - 1)
-    if f == c:
-        return vals[int(k)]
-    d0 = vals[f] * (c - k)
-    d1 = vals[c] * (k - f)
-    return d0 + d1
+    """Compute a single percentile; zero fallback when empty."""
+    return percentiles(values, (pct,))[0]
+
+
+def safe_rate(count: float, elapsed: float) -> float:
+    """count/elapsed, or NaN when no time elapsed.
+
+    NaN is the honest value for "rate undefined" and pandas/seaborn drop
+    it from aggregations, whereas an inf sentinel would poison means and
+    bar scales downstream.
+    """
+    return count / elapsed if elapsed else float("nan")
 
 
 def mean(values: Sequence[float] | Iterable[float]) -> float:
-    """Safe mean with zero fallback."""
-    vals = list(values)
-    return statistics.mean(vals) if vals else 0.0
+    """Safe mean with zero fallback.
+
+    A single C reduction over the float64 view; statistics.mean's
+    exact-ratio arithmetic is overkill for benchmark latency floats.
+    """
+    a = _as_float_array(values)
+    return float(a.mean()) if a.size else 0.0
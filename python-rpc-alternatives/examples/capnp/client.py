@@ -1,9 +1,25 @@
+import asyncio
+import os
+
 import capnp
 
-calculator_capnp = capnp.load("calculator.capnp")
+_SCHEMA = None
+
+def _schema():
+    # Parse calculator.capnp once per process; resolving against __file__
+    # means the example works from any working directory.
+    global _SCHEMA
+    if _SCHEMA is None:
+        _SCHEMA = capnp.load(os.path.join(os.path.dirname(__file__), "calculator.capnp"))
+    return _SCHEMA
+
+async def main():
+    async with capnp.kj_loop():
+        stream = await capnp.AsyncIoStream.create_connection(host="localhost", port=7000)
+        client = capnp.TwoPartyClient(stream)
+        calc = client.bootstrap().cast_as(_schema().Calculator)
+        resp = await calc.add(2, 5)
+        print("2 + 5 =", resp.result)
 
 if __name__ == "__main__":
-    client = capnp.TwoPartyClient(("localhost", 7000))
-    calc = client.bootstrap().cast_as(calculator_capnp.Calculator)
-    resp = calc.add(2, 5).wait()
-    print("2 + 5 =", resp.result)
+    asyncio.run(main())
@@ -1,12 +1,42 @@
+import asyncio
+import os
+
 import capnp
 
-calculator_capnp = capnp.load("calculator.capnp")
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_SCHEMA = None
+
+def _schema():
+    # Parse calculator.capnp once per process; resolving against __file__
+    # means the example works from any working directory.
+    global _SCHEMA
+    if _SCHEMA is None:
+        _SCHEMA = capnp.load(os.path.join(os.path.dirname(__file__), "calculator.capnp"))
+    return _SCHEMA
 
-class Calculator(calculator_capnp.Calculator.Server):
-    def add(self, a, b, _context, **_kwargs):
+class Calculator(_schema().Calculator.Server):
+    # The asyncio API requires coroutine handlers
+    async def add(self, a, b, _context, **_kwargs):
         return a + b
 
+async def new_connection(stream):
+    await capnp.TwoPartyServer(stream, bootstrap=Calculator()).on_disconnect()
+
+async def main():
+    # kj_loop bridges capnp's KJ event loop onto asyncio, so RPC turns run
+    # on the same loop as the socket accept path instead of a dedicated
+    # blocking listen() thread.
+    async with capnp.kj_loop():
+        server = await capnp.AsyncIoStream.create_server(new_connection, "localhost", 7000)
+        print("Cap'n Proto server listening on 7000")
+        async with server:
+            await server.serve_forever()
+
 if __name__ == "__main__":
-    server = capnp.TwoPartyServer(("localhost", 7000), bootstrap=Calculator())
-    print("Cap'n Proto server listening on 7000")
-    server.listen()
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
@@ -1,10 +1,34 @@
-from jsonrpclib.SimpleJSONRPCServer import SimpleJSONRPCServer
+import orjson
+from aiohttp import web
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# jsonrpclib's SimpleJSONRPCServer handles one blocking request at a time
+# and parses with stdlib json; serving the same protocol over aiohttp with
+# orjson lets concurrent clients share the event loop. jsonrpclib clients
+# still work unchanged - it's JSON-RPC over HTTP POST either way.
+
+METHODS = {
+    "add": lambda params: params[0] + params[1],
+}
+
+
+async def rpc(request):
+    payload = orjson.loads(await request.read())
+    result = METHODS[payload["method"]](payload["params"])
+    return web.Response(
+        body=orjson.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": result}),
+        content_type="application/json",
+    )
 
-def add(a, b):
-    return a + b
 
 if __name__ == "__main__":
-    server = SimpleJSONRPCServer(("0.0.0.0", 4000))
-    server.register_function(add)
+    if uvloop is not None:
+        uvloop.install()
+    app = web.Application()
+    app.router.add_post("/", rpc)
     print("JSON-RPC server listening on 4000")
-    server.serve_forever()
+    web.run_app(app, host="0.0.0.0", port=4000)
@@ -1,8 +1,21 @@
+import os
+
 import thriftpy2
 from thriftpy2.rpc import make_client
 
-calculator_thrift = thriftpy2.load("calculator.thrift", module_name="calculator_thrift")
+_SCHEMA = None
+
+def _schema():
+    # Parse calculator.thrift once per process; resolving against __file__
+    # means the example works from any working directory.
+    global _SCHEMA
+    if _SCHEMA is None:
+        _SCHEMA = thriftpy2.load(
+            os.path.join(os.path.dirname(__file__), "calculator.thrift"),
+            module_name="calculator_thrift",
+        )
+    return _SCHEMA
 
 if __name__ == "__main__":
-    with make_client(calculator_thrift.Calculator, "localhost", 9090) as client:
+    with make_client(_schema().Calculator, "localhost", 9090) as client:
         print("2 + 5 =", client.add(2, 5))
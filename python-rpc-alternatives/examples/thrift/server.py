@@ -1,13 +1,26 @@
+import os
+
 import thriftpy2
 from thriftpy2.rpc import make_server
 
-calculator_thrift = thriftpy2.load("calculator.thrift", module_name="calculator_thrift")
+_SCHEMA = None
+
+def _schema():
+    # Parse calculator.thrift once per process; resolving against __file__
+    # means the example works from any working directory.
+    global _SCHEMA
+    if _SCHEMA is None:
+        _SCHEMA = thriftpy2.load(
+            os.path.join(os.path.dirname(__file__), "calculator.thrift"),
+            module_name="calculator_thrift",
+        )
+    return _SCHEMA
 
 class CalculatorHandler:
     def add(self, a, b):
         return a + b
 
 if __name__ == "__main__":
-    server = make_server(calculator_thrift.Calculator, CalculatorHandler(), "0.0.0.0", 9090)
+    server = make_server(_schema().Calculator, CalculatorHandler(), "0.0.0.0", 9090)
     print("Thrift server listening on 9090")
     server.serve()
@@ -2,8 +2,11 @@ import msgpack
 import zmq
 
 ctx = zmq.Context()
-sock = ctx.socket(zmq.REQ)
+# DEALER talks to the ROUTER server without REQ's send/recv lockstep; the
+# empty first frame mirrors the envelope REQ would add.
+sock = ctx.socket(zmq.DEALER)
 sock.connect("tcp://localhost:5555")
-sock.send(msgpack.dumps({"method": "add", "params": [2, 5]}))
-resp = msgpack.loads(sock.recv(), raw=False)
+sock.send_multipart([b"", msgpack.dumps({"method": "add", "params": [2, 5]})])
+_, body = sock.recv_multipart()
+resp = msgpack.unpackb(body, raw=False)
 print(resp)
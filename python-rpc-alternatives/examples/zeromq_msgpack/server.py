@@ -1,15 +1,39 @@
+import asyncio
+
 import msgpack
 import zmq
+import zmq.asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# A long-lived Packer reuses its internal buffer across replies instead of
+# allocating a fresh one per msgpack.dumps call.
+packer = msgpack.Packer(use_bin_type=True)
+
+
+async def serve() -> None:
+    ctx = zmq.asyncio.Context()
+    # ROUTER accepts requests from many clients concurrently; REP would
+    # force a strict recv/send lockstep with one peer at a time.
+    sock = ctx.socket(zmq.ROUTER)
+    sock.bind("tcp://*:5555")
+    print("ZeroMQ msgpack server listening on 5555")
+
+    while True:
+        ident, _, body = await sock.recv_multipart()
+        req = msgpack.unpackb(body, raw=False)
+        if req.get("method") == "add":
+            a, b = req.get("params", [0, 0])
+            resp = {"result": a + b}
+        else:
+            resp = {"error": "unknown method"}
+        await sock.send_multipart([ident, b"", packer.pack(resp)])
+
 
-ctx = zmq.Context()
-sock = ctx.socket(zmq.REP)
-sock.bind("tcp://*:5555")
-print("ZeroMQ msgpack server listening on 5555")
-
-while True:
-    req = msgpack.loads(sock.recv(), raw=False)
-    if req.get("method") == "add":
-        a, b = req.get("params", [0, 0])
-        sock.send(msgpack.dumps({"result": a + b}))
-    else:
-        sock.send(msgpack.dumps({"error": "unknown method"}))
+if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(serve())